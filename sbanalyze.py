@@ -43,7 +43,9 @@
 #
 
 import argparse
-import itertools
+import concurrent.futures
+import io
+import math
 import operator
 import os
 import re
@@ -51,10 +53,12 @@ import statistics
 import sys
 import textwrap
 
-current_line_num = 0
-
 SCHED_CAPACITY_SCALE = 1024
 
+# Logs are read in large binary chunks to avoid per-line reads and decoding
+LOG_READ_BUFFER_SIZE = 1 << 20
+LOG_CHUNK_SIZE = 1 << 16
+
 DT_ROOT_HEADER = '''
 / {
 '''
@@ -81,10 +85,14 @@ DT_EM_FOOTER ='''\t}; /* energy-costs */
 DT_ROOT_FOOTER = '''};
 '''
 
-# Regexes used for parsing
-LOG_START_REGEX = re.compile(r'sultan_bench: START: CPU(\d+): \[\s*(\d+) kHz\]')
-LOG_POWER_REGEX = re.compile(r'sultan_bench: power usage \[\s*(\d+) mW\]')
-LOG_STOP_REGEX = re.compile(r'sultan_bench: STOP: CPU(\d+): \[\s*(\d+) kHz\] \[\s*(\d+) us\]')
+# Regex used for parsing
+# All three line types are matched by a single alternation so that each line
+# only needs to be scanned once; the groups that are set identify the type.
+LOG_LINE_REGEX = re.compile(rb'sultan_bench: (?:'
+                            rb'START: CPU(?P<start_cpu>\d+): \[\s*(?P<start_khz>\d+) kHz\]|'
+                            rb'power usage \[\s*(?P<power_mw>\d+) mW\]|'
+                            rb'STOP: CPU(?P<stop_cpu>\d+): \[\s*(?P<stop_khz>\d+) kHz\] \[\s*(?P<stop_us>\d+) us\])')
+LOG_NO_MATCH_GROUPS = (None,) * LOG_LINE_REGEX.groups
 
 INFO_BEGIN = '\x1b[1;32m'
 INFO_END = '\x1b[0m'
@@ -103,52 +111,61 @@ def log_item(message):
 def log_error(cluster, message):
     print(f'Cluster {cluster}: {ERROR_BEGIN}{message}{ERROR_END}', file=sys.stderr)
 
-def compare_by_eff(first_time_us):
-    def comparator(vals):
-        power_mw, time_us = vals[1]
-        return power_mw * time_us / first_time_us
+def iter_log_lines(in_file):
+    # Split each chunk into lines, carrying any partial last line over to the next chunk
+    # The partial line is kept in pieces so that long lines aren't copied for every chunk
+    partial = []
+    while chunk := in_file.read(LOG_CHUNK_SIZE):
+        # Treat CRLF line endings like text mode's universal newlines did
+        lines = chunk.replace(b'\r\n', b'\n').split(b'\n')
+        if len(lines) == 1:
+            # No line ends in this chunk; keep collecting the partial line
+            partial.append(chunk)
+            continue
 
-    return comparator
+        # Finish the partial line, dropping the CR if its CRLF was split across chunks
+        if chunk.startswith(b'\n') and partial:
+            partial[-1] = partial[-1].removesuffix(b'\r')
+        partial.append(lines[0])
+        lines[0] = b''.join(partial)
+        partial = [lines.pop()]
+        yield from lines
 
-def remove_indices_from_list(val_list, idx_list):
-    for idx in sorted(idx_list, reverse=True):
-        del val_list[idx]
+    # Don't drop the last line if the log doesn't end with a newline
+    tail = b''.join(partial).removesuffix(b'\r')
+    if tail:
+        yield tail
 
-    return val_list
+def drop_indices(val_list, idx_list):
+    # Rebuild the list in one pass rather than deleting (and shifting) item by item
+    idx_set = set(idx_list)
+    return [val for idx, val in enumerate(val_list) if idx not in idx_set]
 
 def get_midrange(values):
-    # Get mean and stddev
-    mean = statistics.mean(values)
-    stddev = statistics.stdev(values)
+    # Get mean and sample stddev using float math; exact rational arithmetic isn't needed here
+    mean = statistics.fmean(values)
+    stddev = math.sqrt(sum((val - mean) ** 2 for val in values) / (len(values) - 1))
 
-    # Locate outliers (i.e. delta from mean > stddev * 1.5)
-    to_remove = []
+    # Keep values that aren't outliers (i.e. delta from mean <= stddev * 1.5)
     threshold = stddev * 1.5
-    for idx, val in enumerate(values):
-        delta = abs(val - mean)
-        if delta > threshold:
-            to_remove.append(idx)
+    kept = [val for val in values if abs(val - mean) <= threshold]
 
-    # Remove the outliers
-    remove_indices_from_list(values, to_remove)
-
-    # Calculate midrange now that outliers have been removed
-    _min = min(values)
-    _max = max(values)
-    return (_min + _max) / 2
+    # Calculate midrange now that outliers have been excluded
+    return (min(kept) + max(kept)) / 2
 
 ### Cluster data processing ###
 
 def parse_log(data_tbl, in_file, out_file):
-    global current_line_num
-
     # Initialize data containers and active flag
     cur_freq = 0
     freq_pwr_list = []
     freq_time_list = []
     is_benching = False
-    cores = 0
-    count_cores = True
+    first_freq = 0
+    cpus_seen = set()
+
+    # Cache the log write method since it's used on every line
+    write = out_file.write
 
     # Define helper to finish freqs because we need to invoke it at the end as well
     def finish_freq():
@@ -158,117 +175,141 @@ def parse_log(data_tbl, in_file, out_file):
                 time_us_med = statistics.median(freq_time_list)
                 data_tbl[cur_freq] = (power_mw_mid, time_us_med)
 
-                out_file.write(f'  - Midrange power usage: {power_mw_mid} mW\n')
-                out_file.write(f'  - Median performance: {time_us_med} μs\n')
+                write(f'  - Midrange power usage: {power_mw_mid} mW\n')
+                write(f'  - Median performance: {time_us_med} μs\n')
             else:
-                out_file.write(f'  * Ignored incomplete frequency: {freq_khz} kHz\n')
-
-    # Read the input file, line by line
-    for line in in_file:
-        current_line_num += 1
-
-        if 'START' in line:
-            # Match regex to extract values
-            match = LOG_START_REGEX.search(line)
-            if not match:
-                out_file.write(f'  * Ignoring malformed START line: "{line}"\n')
-
-            # Get values from match
-            cpu_num = int(match.group(1))
-            freq_khz = int(match.group(2))
-
-            # Increment core counter if counting
-            if count_cores:
-                cores += 1
-
-            # Skip if already switched (each core prints a START line)
-            if freq_khz == cur_freq:
-                continue
-
-            # Finish off the previous freq because now we know it's done for good
-            finish_freq()
-
-            # We're starting to bench a new freq; clear data containers in preparation
-            # and set active flag
-            cur_freq = freq_khz
-            freq_pwr_list = []
-            freq_time_list = []
-            is_benching = True
-
-            # Write freq header to log
-            out_file.write(f'\nFrequency: {cur_freq} kHz\n')
-        elif 'power usage' in line:
-            # Match regex to extract value
-            match = LOG_POWER_REGEX.search(line)
-            if not match:
-                out_file.write(f'  * Ignoring malformed power usage line: "{line}"\n')
-
-            # Get value from match
-            power_mw = int(match.group(1))
-
-            if cur_freq and is_benching:
-                # Value came while benching; record it
-                freq_pwr_list.append(power_mw)
-            else:
-                # Encountered power value while not actively benching
-                # This is normal because the power readings come from a separate thread; ignore and move on
-                out_file.write(f'  * Ignored stray power value: {power_mw} mW\n')
-        elif 'STOP' in line:
-            # Match regex to extract values
-            match = LOG_STOP_REGEX.search(line)
-            if not match:
-                out_file.write(f'  * Ignoring malformed STOP line: "{line}"\n')
-
-            # Get values from match
-            cpu_num = int(match.group(1))
-            freq_khz = int(match.group(2))
-            time_us = int(match.group(3))
-
-            if cur_freq != freq_khz:
-                # Stopped freq is NOT the freq we're currently benching; warn and move on
-                out_file.write(f'  * Ignored performance value ({time_us} μs) for {freq_khz} kHz\n')
-                out_file.write('      * There may be synchronization issues')
-            elif cur_freq:
-                # Stopped freq matches current freq; record the time and ignore further power values
-                count_cores = False
-                freq_time_list.append(time_us)
-                is_benching = False
+                write(f'  * Ignored incomplete frequency: {freq_khz} kHz\n')
+
+    # Cache method lookups as locals for the hot loop below
+    search_line = LOG_LINE_REGEX.search
+    append_pwr = freq_pwr_list.append
+    append_time = freq_time_list.append
+    _int = int
+
+    line_num = 0
+    try:
+        # Read the input file, line by line
+        for line_num, line in enumerate(iter_log_lines(in_file), 1):
+            # Match regex and unpack all groups at once; only the matched line type's groups are set
+            match = search_line(line)
+            start_cpu, start_khz, power_mw, stop_cpu, stop_khz, stop_us = match.groups() if match else LOG_NO_MATCH_GROUPS
+
+            if start_khz is not None:
+                # Get values from match
+                cpu_num = _int(start_cpu)
+                freq_khz = _int(start_khz)
+
+                # Count cores using the first freq's START lines (each core prints one)
+                if not first_freq:
+                    first_freq = freq_khz
+                if freq_khz == first_freq:
+                    cpus_seen.add(cpu_num)
+
+                # Skip if already switched (each core prints a START line)
+                if freq_khz == cur_freq:
+                    continue
+
+                # Finish off the previous freq because now we know it's done for good
+                finish_freq()
+
+                # We're starting to bench a new freq; clear data containers in preparation
+                # and set active flag
+                cur_freq = freq_khz
+                freq_pwr_list = []
+                freq_time_list = []
+                append_pwr = freq_pwr_list.append
+                append_time = freq_time_list.append
+                is_benching = True
+
+                # Write freq header to log
+                write(f'\nFrequency: {cur_freq} kHz\n')
+            elif power_mw is not None:
+                # Get value from match
+                power_mw = _int(power_mw)
+
+                if cur_freq and is_benching:
+                    # Value came while benching; record it
+                    append_pwr(power_mw)
+                else:
+                    # Encountered power value while not actively benching
+                    # This is normal because the power readings come from a separate thread; ignore and move on
+                    write(f'  * Ignored stray power value: {power_mw} mW\n')
+            elif stop_us is not None:
+                # Get values from match
+                cpu_num = _int(stop_cpu)
+                freq_khz = _int(stop_khz)
+                time_us = _int(stop_us)
+
+                if cur_freq != freq_khz:
+                    # Stopped freq is NOT the freq we're currently benching; warn and move on
+                    write(f'  * Ignored performance value ({time_us} μs) for {freq_khz} kHz\n')
+                    write('      * There may be synchronization issues')
+                elif cur_freq:
+                    # Stopped freq matches current freq; record the time and ignore further power values
+                    append_time(time_us)
+                    is_benching = False
+                else:
+                    # Encountered STOP line before we started benching a freq; warn and move on
+                    write(f'  * Ignored stray performance value: {time_us} μs\n')
+                    write('      * Log may be incomplete\n')
             else:
-                # Encountered STOP line before we started benching a freq; warn and move on
-                out_file.write(f'  * Ignored stray performance value: {time_us} μs\n')
-                out_file.write('      * Log may be incomplete\n')
-        else:
-            # Another driver interfered; warn and move on
-            out_file.write(f'  * Ignored unknown line: "{line}"\n')
-            out_file.write('      * Proper isolation is necessary for good results\n')
+                # Another driver interfered; warn and move on
+                line = line.decode(errors='replace')
+                write(f'  * Ignored unknown line: "{line}"\n')
+                write('      * Proper isolation is necessary for good results\n')
+
+        # Finish the last frequency
+        finish_freq()
+    except Exception as e:
+        # Include the line number since it's lost once the error leaves this function
+        raise ValueError(f'Error on line {line_num}') from e
+
+    return len(cpus_seen)
+
+def parse_log_file(in_path, in_data=None):
+    # Parse a log in isolation (i.e. in a worker process) and hand the results back
+    # Logs that the worker can't open itself (i.e. stdin) are passed in as data instead
+    data_tbl = {}
+    out_file = io.StringIO()
+    if in_data is not None:
+        in_file = io.BytesIO(in_data)
+    else:
+        in_file = open(in_path, 'rb', buffering=LOG_READ_BUFFER_SIZE)
 
-    # Finish the last frequency
-    finish_freq()
+    with in_file:
+        try:
+            cores = parse_log(data_tbl, in_file, out_file)
+        except Exception as e:
+            # Hand back what was logged so far so the partial log can still be written
+            e.parse_log_text = out_file.getvalue()
+            raise
 
-    print(f'        > Found {cores} cores')
+    return data_tbl, cores, out_file.getvalue()
 
 def write_c_table(out_path, data_tbl):
-    with open(out_path, 'w+') as out_file:
-        out_file.write('\t/* Format: { freq_khz, power_mw, time_us } */\n')
+    # Assemble the whole table first so that it can be written in one go
+    lines = ['\t/* Format: { freq_khz, power_mw, time_us } */\n']
 
-        last_power_mw = None
-        for freq_khz, (power_mw, time_us) in data_tbl.items():
-            if last_power_mw is not None and last_power_mw > power_mw:
-                out_file.write('\t/* Power usage dropped: %.1f -> %.1f mW */\n' % (last_power_mw, power_mw))
+    last_power_mw = None
+    for freq_khz, (power_mw, time_us) in data_tbl.items():
+        if last_power_mw is not None and last_power_mw > power_mw:
+            lines.append('\t/* Power usage dropped: %.1f -> %.1f mW */\n' % (last_power_mw, power_mw))
 
-            out_file.write('\t{ %7d, %6.1f, %11.1f },\n' % (freq_khz, power_mw, time_us))
-            last_power_mw = power_mw
+        lines.append('\t{ %7d, %6.1f, %11.1f },\n' % (freq_khz, power_mw, time_us))
+        last_power_mw = power_mw
 
-def write_stat_table(out_path, entries, first_time_us):
     with open(out_path, 'w+') as out_file:
-        out_file.write('Frequency      Power          Speed          Perf Ratio  Efficiency\n\n')
+        out_file.write(''.join(lines))
 
-        for freq_khz, (power_mw, time_us) in entries:
-            perf_ratio = first_time_us / time_us
-            pwr_perf_ratio = power_mw * time_us / first_time_us
+def write_stat_table(out_path, entries, first_time_us):
+    # Assemble the whole table first so that it can be written in one go
+    lines = ['Frequency      Power          Speed          Perf Ratio  Efficiency\n\n']
+    lines += ['%7u kHz\t %8.1f mW\t %9u μs\t %.3f x\t %5.1f mW/perf\n' %
+              (freq_khz, power_mw, time_us, first_time_us / time_us, power_mw * time_us / first_time_us)
+              for freq_khz, (power_mw, time_us) in entries]
 
-            out_file.write('%7u kHz\t %8.1f mW\t %9u μs\t %.3f x\t %5.1f mW/perf\n' %
-                       (freq_khz, power_mw, time_us, perf_ratio, pwr_perf_ratio))
+    with open(out_path, 'w+') as out_file:
+        out_file.write(''.join(lines))
 
 
 ### EAS data processing ###
@@ -281,16 +322,36 @@ def _write_cpu_caps_dt(out_file):
 
         out_file.write(DT_CPU_CORE_FOOTER)
 
-def _write_em_dt(freq_data, out_file, old_min, old_max, all_entries, best_time_us, key_type, value_type):
-    max_mw_perf_ent = max(all_entries, key=lambda ent: ent[0] * ent[1] / best_time_us)
-    max_mw_perf = max_mw_perf_ent[0] * max_mw_perf_ent[1] / best_time_us
-
+# Core cost row generators, specialized for each (key, value) format so that the
+# per-row loops don't need to branch on the format
+# Keys are frequencies/capacities and values are (normalized) costs
+def _em_rows_freq_power(data_tbl, best_time_us, max_mw_perf, factor, base):
+    return ['\t\t\t\t%7u %4.0f\n' % (freq_khz, power_mw * factor + base)
+            for freq_khz, (power_mw, time_us) in data_tbl.items()]
+
+def _em_rows_freq_eff(data_tbl, best_time_us, max_mw_perf, factor, base):
+    return ['\t\t\t\t%7u %4.0f\n' % (freq_khz, max_mw_perf * SCHED_CAPACITY_SCALE / (power_mw * time_us / best_time_us) * factor + base)
+            for freq_khz, (power_mw, time_us) in data_tbl.items()]
+
+def _em_rows_cap_power(data_tbl, best_time_us, max_mw_perf, factor, base):
+    return ['\t\t\t\t%4u %4.0f\n' % (best_time_us * SCHED_CAPACITY_SCALE / time_us, power_mw * factor + base)
+            for power_mw, time_us in data_tbl.values()]
+
+def _em_rows_cap_eff(data_tbl, best_time_us, max_mw_perf, factor, base):
+    return ['\t\t\t\t%4u %4.0f\n' % (best_time_us * SCHED_CAPACITY_SCALE / time_us,
+                                        max_mw_perf * SCHED_CAPACITY_SCALE / (power_mw * time_us / best_time_us) * factor + base)
+            for power_mw, time_us in data_tbl.values()]
+
+EM_ROW_GENERATORS = {
+    ('freq', 'power'): _em_rows_freq_power,
+    ('freq', 'eff'): _em_rows_freq_eff,
+    ('cap', 'power'): _em_rows_cap_power,
+    ('cap', 'eff'): _em_rows_cap_eff,
+}
+
+def _write_em_dt(freq_data, out_file, old_min, old_max, new_min_power, new_max_power, max_mw_perf, best_time_us, key_type, value_type):
     # Generate normalization base and factor if requested
     if old_min and old_max:
-        # Get new min and max power usage
-        new_min_power = min(all_entries, key=operator.itemgetter(0))[0]
-        new_max_power = max(all_entries, key=operator.itemgetter(0))[0]
-
         factor = (old_max - old_min) / (new_max_power - new_min_power)
         base = old_min - (factor * new_min_power)
     else:
@@ -298,91 +359,105 @@ def _write_em_dt(freq_data, out_file, old_min, old_max, all_entries, best_time_u
         factor = 1
         base = 0
 
-    out_file.write(DT_EM_HEADER)
-
-    # Calculate and write core costs
-    for cluster, data_tbl in enumerate(freq_data):
-        out_file.write(DT_EM_COSTS_HEADER.format('CPU', 'core', cluster))
-
-        for freq_khz, (power_mw, time_us) in data_tbl.items():
-            # Calculate key (i.e. frequency/capacity)
-            if key_type == 'freq':
-                key = freq_khz
-                expected_key_len = 7
-            elif key_type == 'cap':
-                key = best_time_us * SCHED_CAPACITY_SCALE / time_us
-                expected_key_len = 4
-            else:
-                # Don't know how to handle this key type; bail out
-                raise ValueError(f"Unknown key type '{key_type}'")
-
-            # Calculate value (i.e. cost)
-            if value_type == 'power':
-                value = power_mw
-            elif value_type == 'eff':
-                mw_perf = power_mw * time_us / best_time_us
-                value = max_mw_perf * SCHED_CAPACITY_SCALE / mw_perf
-
-            # Normalize value if necessary
-            value = value * factor + base
+    # Pick the row generator for the format
+    try:
+        em_rows = EM_ROW_GENERATORS[key_type, value_type]
+    except KeyError:
+        # Don't know how to handle this format; bail out
+        raise ValueError(f"Unknown key/value type '{key_type}'/'{value_type}'") from None
 
-            # Write final tuple
-            out_file.write(f'\t\t\t\t%{expected_key_len}u %4.0f\n' % (key, value))
+    # Buffer output lines and write them out all at once at the end
+    dt_lines = []
+    write = dt_lines.append
 
-        out_file.write(DT_EM_COSTS_FOOTER)
+    write(DT_EM_HEADER)
 
-    # Calculate and write cluster costs
+    # Calculate and write core costs
     for cluster, data_tbl in enumerate(freq_data):
-        out_file.write(DT_EM_COSTS_HEADER.format('CLUSTER', 'cluster', cluster))
-
-        for freq_khz, (power_mw, time_us) in data_tbl.items():
-            pass
-
-        out_file.write(DT_EM_COSTS_FOOTER)
-
-
-    out_file.write(DT_EM_FOOTER)
-
-def write_eas_model_dt(freq_data, out_file, old_min, old_max, key_type='freq', value_type='power'):
-
-    # Collect a flat list of all freq data entries for locating min/max values
-    all_entries = list(itertools.chain.from_iterable(tbl.values() for tbl in freq_data))
-    best_time_us = min(all_entries, key=operator.itemgetter(1))[1]
+        write(DT_EM_COSTS_HEADER.format('CPU', 'core', cluster))
+        dt_lines += em_rows(data_tbl, best_time_us, max_mw_perf, factor, base)
+        write(DT_EM_COSTS_FOOTER)
+
+    # Write cluster costs
+    # Cluster costs aren't calculated yet, so only write empty nodes
+    for cluster in range(len(freq_data)):
+        write(DT_EM_COSTS_HEADER.format('CLUSTER', 'cluster', cluster))
+        write(DT_EM_COSTS_FOOTER)
+
+    write(DT_EM_FOOTER)
+    out_file.write(''.join(dt_lines))
+
+def get_em_stats(freq_data):
+    # Locate min/max values across all freq data entries in a single pass
+    best_time_us = math.inf
+    max_mw_time = -math.inf
+    new_min_power = math.inf
+    new_max_power = -math.inf
+    for data_tbl in freq_data:
+        for power_mw, time_us in data_tbl.values():
+            mw_time = power_mw * time_us
+            if time_us < best_time_us:
+                best_time_us = time_us
+            if mw_time > max_mw_time:
+                max_mw_time = mw_time
+            if power_mw < new_min_power:
+                new_min_power = power_mw
+            if power_mw > new_max_power:
+                new_max_power = power_mw
+
+    # Dividing by the best time doesn't change which entry is the max, so do it once here
+    max_mw_perf = max_mw_time / best_time_us
+
+    return best_time_us, new_min_power, new_max_power, max_mw_perf
+
+def write_eas_model_dt(freq_data, out_file, old_min, old_max, em_stats, key_type='freq', value_type='power'):
+    best_time_us, new_min_power, new_max_power, max_mw_perf = em_stats
 
     _write_cpu_caps_dt(out_file)
 
     out_file.write(DT_ROOT_HEADER)
-    _write_em_dt(freq_data, out_file, old_min, old_max, all_entries, best_time_us, key_type, value_type)
+    _write_em_dt(freq_data, out_file, old_min, old_max, new_min_power, new_max_power, max_mw_perf, best_time_us, key_type, value_type)
     out_file.write(DT_ROOT_FOOTER)
 
 
 ### CLI ###
 
 def write_eas_models(freq_data, out_prefix, old_min, old_max, *, keys, values, comment=''):
+    # The stats only depend on the freq data, so share them between all formats
+    em_stats = get_em_stats(freq_data)
+
     for k in keys:
         for v in values:
             log_item(f'In ({k}, {v}) format{comment}')
             filename = f'{out_prefix}{k}-{v}.dtsi'
 
             with open(filename, 'w+') as out_file:
-                write_eas_model_dt(freq_data, out_file, old_min, old_max, key_type=k, value_type=v)
+                write_eas_model_dt(freq_data, out_file, old_min, old_max, em_stats, key_type=k, value_type=v)
 
 def process_data_cl(data_tbl, out_prefix):
     # Write a C data table for further analysis
     log_item('C data table')
     write_c_table(out_prefix + 'data.c', data_tbl)
 
-    unsorted_entries = list(data_tbl.items())
+    entries = list(data_tbl.items())
 
     # Sort entries by freq and write the table
+    # Logs normally bench freqs in ascending order, so only sort if that isn't the case
     log_item('Stat table (sorted by frequency)')
-    khz_sorted = sorted(unsorted_entries, key=operator.itemgetter(0))
+    if all(cur[0] < nxt[0] for cur, nxt in zip(entries, entries[1:])):
+        khz_sorted = entries
+    else:
+        khz_sorted = sorted(entries, key=operator.itemgetter(0))
     first_time_us = khz_sorted[0][1][1]
     write_stat_table(out_prefix + 'stats_by_khz.tsv', khz_sorted, first_time_us)
 
     # Sort entries by eff and write the table
     log_item('Stat table (sorted by efficiency)')
-    eff_sorted = sorted(unsorted_entries, key=compare_by_eff(first_time_us))
+    # Efficiency is power * time / first_time_us, but the constant divisor doesn't affect
+    # the order, so sort on precomputed power * time keys to avoid a key callback per entry
+    eff_decorated = [(power_mw * time_us, (freq_khz, (power_mw, time_us))) for freq_khz, (power_mw, time_us) in entries]
+    eff_decorated.sort(key=operator.itemgetter(0))
+    eff_sorted = [entry for _, entry in eff_decorated]
     write_stat_table(out_prefix + 'stats_by_eff.tsv', eff_sorted, first_time_us)
 
     # Remove inefficient entries from eff-sorted list and write the table
@@ -396,12 +471,27 @@ def process_data_cl(data_tbl, out_prefix):
 
         last_freq_khz = freq_khz
 
-    remove_indices_from_list(eff_sorted, inefficient_indices)
+    eff_sorted = drop_indices(eff_sorted, inefficient_indices)
     write_stat_table(out_prefix + 'efficient_freqs.tsv', eff_sorted, first_time_us)
 
     # Return the efficient table for later use
     return eff_sorted
 
+def input_log_path(path):
+    # Make sure the log can be opened up front, like argparse.FileType does, but only
+    # pass the path on so that the parser workers can open it themselves
+    # '-' means stdin, just like it does for argparse.FileType
+    if path == '-':
+        return path
+
+    try:
+        with open(path, 'rb'):
+            pass
+    except OSError as e:
+        raise argparse.ArgumentTypeError(f"can't open '{path}': {e}")
+
+    return path
+
 def parse_arguments():
     # Wrap descriptions to 80 chars
     parser = argparse.ArgumentParser(
@@ -423,7 +513,7 @@ def parse_arguments():
     )
 
     io_grp = parser.add_argument_group('I/O arguments (required)', "Arguments that control the program's I/O behavior.")
-    io_grp.add_argument('-i', '--input-logs', nargs='+', type=argparse.FileType('r'), required=True, help='logs to analyze')
+    io_grp.add_argument('-i', '--input-logs', nargs='+', type=input_log_path, required=True, help='logs to analyze')
     io_grp.add_argument('-o', '--output-dir', required=True, help='directory to write results to')
 
     eas_grp = parser.add_argument_group('EAS arguments (optional)', 'Arguments that manipulate EAS energy model generator parameters.')
@@ -444,25 +534,41 @@ def main():
 
     # Create frequency data array
     # Format: [ cluster: { freq_khz: (power_mw, time_us) } ]
-    freq_data = [{} for cluster in range(len(args.input_logs))]
+    # Tables are appended in cluster order as parsing results are collected
+    freq_data = []
     eff_freq_data = []
 
     # Parse all data first
+    # Each cluster's log is independent, so parse them all in parallel
     log_header('Parsing data...')
-    for cluster, in_file in enumerate(args.input_logs):
-        cl_prefix = f'cl{cluster}_'
-        log_item(f'Cluster {cluster}')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(args.input_logs)) as executor:
+        futures = []
+        for in_path in args.input_logs:
+            # Workers can't read our stdin, so read it here and pass the data along
+            in_data = sys.stdin.buffer.read() if in_path == '-' else None
+            futures.append(executor.submit(parse_log_file, in_path, in_data))
+
+        # Collect results in cluster order to keep the output consistent
+        for cluster, future in enumerate(futures):
+            cl_prefix = f'cl{cluster}_'
+            log_item(f'Cluster {cluster}')
+            out_log_path = os.path.join(args.output_dir, f'{cl_prefix}parse.log')
 
-        data_tbl = freq_data[cluster]
-        out_log_path = os.path.join(args.output_dir, f'{cl_prefix}parse.log')
-        with open(out_log_path, 'w+') as out_file:
             try:
-                parse_log(data_tbl, in_file, out_file)
-            except:
-                log_error(cluster, f'Error on line {current_line_num}')
+                data_tbl, cores, parse_log_text = future.result()
+            except Exception as e:
+                # Write out everything logged up to the failure to help track it down
+                with open(out_log_path, 'w+') as out_file:
+                    out_file.write(getattr(e, 'parse_log_text', ''))
+
+                log_error(cluster, str(e))
                 raise
-            finally:
-                in_file.close()
+
+            freq_data.append(data_tbl)
+            print(f'        > Found {cores} cores')
+
+            with open(out_log_path, 'w+') as out_file:
+                out_file.write(parse_log_text)
 
     # Process data *after* all parsing is complete in order to get overall min/max
     log_header('\nProcessing data...')